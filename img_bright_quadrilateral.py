@@ -73,31 +73,54 @@ def get_allpatches_with_brightness_value(gray_im: np.ndarray,
     if gray_im.shape[0] < 5 or gray_im.shape[1] < 5:
         return None
 
-    def _check_overlap(test_patch, patch_list, patch_size):
-        if len(patch_list) == 0:
-            return False
-        for _patch in patch_list:
-            if (abs(test_patch[1] - _patch[1]) < patch_size) and \
-                    (abs(test_patch[2] - _patch[2]) < patch_size):
-                return True
-        return False
-
-    total_patches = []
-    for row in range(gray_im.shape[0] - patch_size + 1):
-        for col in range(gray_im.shape[1] - patch_size + 1):
-            curr_patch = gray_im[row : row + patch_size, col: col + patch_size]
-            patch_brightness = np.mean(curr_patch)
-            total_patches.append((patch_brightness, row, col))
-    total_patches = sorted(total_patches, key=lambda l: l[0], reverse=True)
-
-    topk_patches = []
-    for patch in total_patches:
-        if len(topk_patches) < max_patch_count:
-            if not _check_overlap(patch, topk_patches, patch_size):
-                topk_patches.append(patch)
+    # summed brightness of every patch, indexed by its top-left corner;
+    # all patches share one size, so sums rank exactly like the means.
+    # The uint8 image is filtered as-is into an int32 accumulator.
+    rows = gray_im.shape[0] - patch_size + 1
+    cols = gray_im.shape[1] - patch_size + 1
+    if rows <= 0 or cols <= 0 or max_patch_count <= 0: # patch does not fit or none requested
+        print("Center points of the brightest patches: []")
+        return []
+    sums = cv2.boxFilter(gray_im, cv2.CV_32S, (patch_size, patch_size),
+                         anchor=(0, 0), normalize=False,
+                         borderType=cv2.BORDER_ISOLATED)[:rows, :cols]
+    flat = sums.ravel()
+
+    # only a small pool of the brightest patches is ranked, the pool is widened
+    # if overlapping patches leave it short of 'max_patch_count' picks.
+    # Ties keep the row-major order of a full stable sort.
+    pool_size = max_patch_count * 64
+    while True:
+        if pool_size < flat.size:
+            kth = np.partition(flat, flat.size - pool_size)[flat.size - pool_size]
+            pool = np.flatnonzero(flat >= kth)
         else:
+            pool = np.arange(flat.size)
+        pool = pool[np.argsort(-flat[pool], kind='stable')]
+
+        # greedy non-maximum suppression over the ranked pool. Kept patches are
+        # hashed on a grid of 'patch_size' cells: two patches in the same cell
+        # always overlap, so a cell holds at most one patch and an overlapping
+        # patch can only sit in one of the 3x3 neighbouring cells.
+        topk_patches = []
+        occupied = {}
+        for idx in pool:
+            if len(topk_patches) == max_patch_count:
+                break
+            row, col = divmod(int(idx), cols)
+            cell_r, cell_c = row // patch_size, col // patch_size
+            if any(abs(row - occupied[cell][0]) < patch_size and
+                   abs(col - occupied[cell][1]) < patch_size
+                   for cell in ((cell_r + dr, cell_c + dc)
+                                for dr in (-1, 0, 1) for dc in (-1, 0, 1))
+                   if cell in occupied):
+                continue
+            occupied[(cell_r, cell_c)] = (row, col)
+            topk_patches.append((row, col))
+        if len(topk_patches) == max_patch_count or pool.size == flat.size:
             break
-    centers = [[i + patch_size//2, j + patch_size//2] for _,i,j in topk_patches]
+        pool_size *= 4
+    centers = [[i + patch_size//2, j + patch_size//2] for i, j in topk_patches]
 
     print(f"Center points of the brightest patches: {centers}")
 
@@ -109,7 +132,14 @@ def distance(p1:tuple[int, int],
     """
     Calculate the Euclidean distance between two points.
     """
-    return ((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2) ** 0.5
+    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
+
+
+def _as_pts(points: list[tuple], dtype=np.float64) -> np.ndarray:
+    """
+    Convert a list of (x, y) coordinates into a contiguous (N, 2) array.
+    """
+    return np.asarray(points, dtype=dtype).reshape(-1, 2)
 
 
 def calc_polar_angle(p1: tuple[int, int],
@@ -139,8 +169,16 @@ def order_coordinates_anticlock(points: list[tuple])-> list[tuple]:
     """
     if len(points) == 0:
         return []
-    centroid = [sum(x for x,_ in points) / len(points), sum(y for _, y in points) / len(points)]
-    points.sort(key=lambda p: (calc_polar_angle(centroid, p), - distance(centroid, p)))
+    cx = sum(x for x,_ in points) / len(points)
+    cy = sum(y for _, y in points) / len(points)
+
+    # (polar angle, -squared distance) around the centroid, computed inline
+    # so each point costs one atan2 and no helper calls
+    def _polar_key(p):
+        dx, dy = p[0] - cx, p[1] - cy
+        return math.atan2(dy, dx), -(dx * dx + dy * dy)
+
+    points.sort(key=_polar_key)
     return points
 
 
@@ -161,28 +199,25 @@ def calc_area(ordered_points: list[tuple])-> float:
         print("Invalid shape to compute area!")
         return None
 
-    # separate X AND Y lists
-    def _separate_xy(xy_pairs:list[tuple] ) -> tuple[list]:
-        x_ls=[]
-        y_ls=[]
-        for _,_pt in enumerate(xy_pairs):
-            x_ls.append(_pt[0])
-            y_ls.append(_pt[1])
-        return x_ls, y_ls
-
-    # area of regular-polygon, from ordered coordinates
-    def _shoelace_area(x_list, y_list):
-        a1, a2 = 0, 0
-        x_list.append(x_list[0])
-        y_list.append(y_list[0])
-        for j in range(len(x_list)-1):
-            a1 += x_list[j]*y_list[j+1]
-            a2 += y_list[j]*x_list[j+1]
-        Area = abs(a1-a2)/2
-        return Area
-
-    xy_e = _separate_xy(ordered_points)
-    return _shoelace_area(xy_e[0], xy_e[1])
+    # shoelace formula over the ordered vertices, closing the polygon by
+    # pairing the first vertex with the last one (index -1)
+    double_area = 0
+    for j in range(len(ordered_points)):
+        x0, y0 = ordered_points[j - 1]
+        x1, y1 = ordered_points[j]
+        double_area += x0 * y1 - y0 * x1
+    return abs(double_area) / 2
+
+
+def _three_share_axis(points: list[tuple]) -> bool:
+    """
+    Check whether 3 of the 4 points share an x or a y co-ordinate.
+    """
+    all_X = sorted(x for x, _ in points)
+    all_Y = sorted(y for _, y in points)
+    # among 4 sorted values, a triple means the 1st equals the 3rd or the 2nd the 4th
+    return all_X[0] == all_X[2] or all_X[1] == all_X[3] or \
+        all_Y[0] == all_Y[2] or all_Y[1] == all_Y[3]
 
 
 # Draw red quadrilateral box
@@ -200,11 +235,7 @@ def draw_quadrilateral(img, points: list[tuple], save_at: str="output_image.png"
     
     """
 
-    all_X = [i for i,_ in points]
-    all_Y = [j for _,j in points]
-    if len(points) != 4 or \
-        any(all_X.count(x) >= 3 for x in set(all_X)) or \
-        any(all_Y.count(x) >= 3 for x in set(all_Y)):
+    if len(points) != 4 or _three_share_axis(points):
         print("Could not find a Quadrilateral!")
         return False
     
@@ -214,8 +245,8 @@ def draw_quadrilateral(img, points: list[tuple], save_at: str="output_image.png"
     quad_area = calc_area(ordered_points=ordered_pts)
     print(f"Area of the formed Quadrilateral: {quad_area} sq. pixels")
     
-    box = [[y,x] for [x,y] in ordered_pts]
-    box = np.array(box).reshape((-1, 1, 2))
+    # (row, col) centers -> (x, y) pixel coordinates
+    box = np.ascontiguousarray(_as_pts(ordered_pts, dtype=np.int32)[:, ::-1]).reshape((-1, 1, 2))
     color = (0, 0, 255) # BGR
     th=1 if img.shape[0] > 300 else 2
     cv2.polylines(img, [box], isClosed=True, color=color, thickness=th)
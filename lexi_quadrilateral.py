@@ -22,15 +22,20 @@
 import os
 import re
 import argparse
+import heapq
 import math
 
 
+# runs of strictly alphanumeric characters (unicode letters/digits excluded)
+_ALNUM_RUN_RE = re.compile(r'[A-Za-z0-9]+')
+
+
 def distance(p1:tuple[int, int],
              p2:tuple[int, int]) -> float:
     """
     Calculate the Euclidean distance between two points.
     """
-    return ((p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2) ** 0.5
+    return math.hypot(p2[0] - p1[0], p2[1] - p1[1])
 
 
 def calc_polar_angle(p1: tuple[int, int],
@@ -60,8 +65,16 @@ def order_coordinates_anticlock(points: list[tuple])-> list[tuple]:
     """
     if len(points) == 0:
         return []
-    centroid = [sum(x for x,_ in points) / len(points), sum(y for _, y in points) / len(points)]
-    points.sort(key=lambda p: (calc_polar_angle(centroid, p), - distance(centroid, p)))
+    cx = sum(x for x,_ in points) / len(points)
+    cy = sum(y for _, y in points) / len(points)
+
+    # (polar angle, -squared distance) around the centroid, computed inline
+    # so each point costs one atan2 and no helper calls
+    def _polar_key(p):
+        dx, dy = p[0] - cx, p[1] - cy
+        return math.atan2(dy, dx), -(dx * dx + dy * dy)
+
+    points.sort(key=_polar_key)
     return points
 
 
@@ -75,14 +88,15 @@ def calc_perimeter(ordered_points: list[tuple])-> float:
     Returns:
         float: The perimeter of the shape.
     """
-    perimeter = 0.0
     if len(ordered_points) < 3:
         print("Invalid shape to compute perimeter!")
         return None
 
-    for i in range(len(ordered_points)-1):
-        perimeter += distance(ordered_points[i], ordered_points[i+1])
-    perimeter += distance(ordered_points[-1], ordered_points[0])
+    perimeter = 0.0
+    prev_pt = ordered_points[-1] # closes the shape
+    for pt in ordered_points:
+        perimeter += distance(prev_pt, pt)
+        prev_pt = pt
     return perimeter
 
 
@@ -102,29 +116,25 @@ def calc_area(ordered_points: list[tuple])-> float:
         print("Invalid shape to compute area!")
         return None
 
-    # separate X AND Y lists
-    def _separate_xy(xy_pairs:list[tuple] ) -> tuple[list]:
-        x_ls=[]
-        y_ls=[]
-        for _,_pt in enumerate(xy_pairs):
-            x_ls.append(_pt[0])
-            y_ls.append(_pt[1])
-        return x_ls, y_ls
-
-    # area of regular-polygon, from ordered coordinates
-    def _shoelace_area(x_list, y_list):
-        a1, a2 = 0, 0
-        x_list.append(x_list[0])
-        y_list.append(y_list[0])
-        for j in range(len(x_list)-1):
-            a1 += x_list[j]*y_list[j+1]
-            a2 += y_list[j]*x_list[j+1]
-        Area = abs(a1-a2)/2
-        return Area
+    # shoelace formula over the ordered vertices, closing the polygon by
+    # pairing the first vertex with the last one (index -1)
+    double_area = 0
+    for j in range(len(ordered_points)):
+        x0, y0 = ordered_points[j - 1]
+        x1, y1 = ordered_points[j]
+        double_area += x0 * y1 - y0 * x1
+    return abs(double_area) / 2
 
-    xy_e = _separate_xy(ordered_points)
-    return _shoelace_area(xy_e[0], xy_e[1])
 
+def _three_share_axis(points: list[tuple]) -> bool:
+    """
+    Check whether 3 of the 4 points share an x or a y co-ordinate.
+    """
+    all_X = sorted(x for x, _ in points)
+    all_Y = sorted(y for _, y in points)
+    # among 4 sorted values, a triple means the 1st equals the 3rd or the 2nd the 4th
+    return all_X[0] == all_X[2] or all_X[1] == all_X[3] or \
+        all_Y[0] == all_Y[2] or all_Y[1] == all_Y[3]
 
 
 def read_textfile(file_path:str)->list:
@@ -171,41 +181,44 @@ def fetch_highlexi_str_with_loc(file_txt: list[str], word_length: int=5, word_co
         List[Tuple[str, int, int]]: A list of tuples containing high-lexicographical substrings,
         their corresponding line IDs, and starting character indices.
     """
+    if word_length < 1:
+        print("Invalid substring length!")
+        return []
 
-    def _is_strictly_alphanumeric(substr):
-        # not considering unicodes
-        is_alphanumeric = re.match(r'^[a-zA-Z0-9]+$', substr) is not None
-        return is_alphanumeric
-
-    def _non_alpanum_index(substr):
-        for i, _ch in enumerate(substr):
-            if not _ch.isalnum() or ord(_ch) > 122: # ignore unicodes
-                return i
-        return 0
+    def _scan_line(line_str, word_length):
+        # start indices of the windows made only of ASCII letters and digits;
+        # every window inside a long enough alphanumeric run is valid
+        starts = []
+        for run in _ALNUM_RUN_RE.finditer(line_str):
+            starts.extend(range(run.start(), run.end() - word_length + 1))
+        return starts
 
-    result_ls = []
+    topk_heap = []
     for line_id, line_str in enumerate(file_txt):
-        ch_id = 0
         topk_substrings = []
-        while ch_id <= (len(line_str) - word_length):
+        for ch_id in _scan_line(line_str, word_length):
             substr = line_str[ch_id: ch_id + word_length]
 
-            if _is_strictly_alphanumeric(substr) and ('\n' not in substr):
-                if len(topk_substrings) == 0:
+            if len(topk_substrings) == 0:
+                topk_substrings.append((substr, line_id, ch_id))
+            elif (abs(ch_id - topk_substrings[-1][2]) < word_length):
+                if substr > topk_substrings[-1][0]:
+                    topk_substrings.pop()
                     topk_substrings.append((substr, line_id, ch_id))
-                elif (abs(ch_id - topk_substrings[-1][2]) < word_length):
-                    if substr > topk_substrings[-1][0]:
-                        topk_substrings.pop()
-                        topk_substrings.append((substr, line_id, ch_id))
-                else:
-                    topk_substrings.append((substr, line_id, ch_id))
-                ch_id += 1
             else:
-                ch_id += _non_alpanum_index(substr)
-                ch_id += 1
+                topk_substrings.append((substr, line_id, ch_id))
+
+        # bounded min-heap of the best substrings so far; on equal substrings
+        # the earlier position ranks higher, hence the negated line and char ids
+        for substr, _, ch_id in topk_substrings:
+            entry = (substr, -line_id, -ch_id)
+            if len(topk_heap) < word_count:
+                heapq.heappush(topk_heap, entry)
+            else:
+                heapq.heappushpop(topk_heap, entry)
 
-        result_ls.extend(topk_substrings)
-        result_ls = sorted(result_ls, key=lambda l: l[0], reverse=True)[: word_count]
+    result_ls = [(substr, -line_id, -ch_id)
+                 for substr, line_id, ch_id in sorted(topk_heap, reverse=True)]
 
     print("Lexicographically largest non-overlapping sub-strings: ",
             [str for str,_,_ in result_ls] )
@@ -236,12 +249,7 @@ if __name__ == "__main__":
                                                                args.word_count)
         coordinates = [(i,j) for _, i, j in topk_substrings_with_loc]
 
-        all_X = [i for _,i,_ in topk_substrings_with_loc]
-        all_Y = [j for _,_,j in topk_substrings_with_loc]
-
-        if len(coordinates) != 4 or \
-                any(all_X.count(x) >= 3 for x in set(all_X)) or \
-                any(all_Y.count(x) >= 3 for x in set(all_Y)):
+        if len(coordinates) != 4 or _three_share_axis(coordinates):
             print("Could not find a Quadrilateral!")
         else:
             ordered_coords = order_coordinates_anticlock(coordinates)
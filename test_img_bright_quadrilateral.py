@@ -102,6 +102,48 @@ def test_get_allpatches_with_brightness_value(sample_gray_image: np.ndarray,
         assert result is None
  
         
+@pytest.mark.parametrize("bright_corners, expected_centers", [
+    ([(0, 0)], [[2, 2]]),  # image border
+    ([(10, 20), (40, 3), (90, 90)], [[12, 22], [42, 5], [92, 92]]),  # distinct patches
+])
+def test_brightest_patch_centers(bright_corners: list, expected_centers: list):
+    gray_im = np.zeros((100, 100), dtype=np.uint8)
+    for value, (row, col) in zip((255, 200, 150), bright_corners):
+        gray_im[row : row + 5, col: col + 5] = value
+    result = ibq.get_allpatches_with_brightness_value(gray_im, 5, len(bright_corners))
+    assert result == expected_centers
+
+
+@pytest.mark.parametrize("im_shape, patch_size, max_patch_count", [
+    ((10, 10), 12, 4),  # patch larger than the image
+    ((39, 5), 7, 2),    # patch wider than the image
+])
+def test_patch_larger_than_image(im_shape: tuple, patch_size: int, max_patch_count: int):
+    gray_im = np.full(im_shape, 255, dtype=np.uint8)
+    result = ibq.get_allpatches_with_brightness_value(gray_im, patch_size, max_patch_count)
+    assert result == []
+
+
+@pytest.mark.parametrize("max_patch_count", [0, -1])
+def test_no_patches_requested(sample_gray_image: np.ndarray, max_patch_count: int):
+    result = ibq.get_allpatches_with_brightness_value(sample_gray_image, 5, max_patch_count)
+    assert result == []
+
+
+# Test overlap suppression across neighbouring grid cells
+def test_brightest_patch_neighbour_cells():
+    gray_im = np.zeros((100, 100), dtype=np.uint8)
+    gray_im[14:21, 14:21] = 250  # cell (2, 2)
+    gray_im[14:21, 21:28] = 240  # cell (2, 3), exactly one patch apart -> kept
+    gray_im[50:57, 56:63] = 220  # cell (7, 8), overlaps the block below -> suppressed
+    gray_im[47:54, 56:63] = 230  # cell (6, 8)
+    result = ibq.get_allpatches_with_brightness_value(gray_im, 7, 5)
+    # [57, 59] covers the uncovered rows of the suppressed block; the dark
+    # [3, 3] patch lies outside the first candidate pool, which only holds
+    # patches touching the bright blocks, so the pool has to be widened
+    assert result == [[17, 17], [17, 24], [50, 59], [57, 59], [3, 3]]
+
+
 @pytest.mark.parametrize("points, expected_result", [
     ([(0, 0), (0, 5), (5, 5), (5, 0)], True),  # Valid points
     ([(0, 0), (0, 5), (5, 5)], False),        # Insufficient points
@@ -70,6 +70,16 @@ def test_fetch_highlexi_str_with_loc(txt_file_path: str, expected_result:list):
     assert result == expected_result
 
 
+# Test non-positive substring length
+@pytest.mark.parametrize('word_length', [0, -1])
+def test_fetch_highlexi_str_invalid_length(word_length: int):
+    file_content = lq.read_textfile("demo.txt")
+    result = lq.fetch_highlexi_str_with_loc(file_txt=file_content,
+                                            word_length=word_length,
+                                            word_count=4)
+    assert result == []
+
+
 # Test perimeter calculation
 @pytest.mark.parametrize(
     ['ordered_points', 'exp_perimeter'],